@@ -0,0 +1,58 @@
+from itertools import count
+from pathlib import Path
+from typing import Dict
+
+from benchmarks.fixtures import make_pdf
+from benchmarks.harness import measure, offline_app
+
+
+def run(workdir: Path, uploads: int = 20, pages: int = 5, llm_latency: float = 0.0) -> Dict[str, dict]:
+    """End-to-end latency of upload, search and literature review routes through ``TestClient``."""
+    pdf_bytes = make_pdf(workdir / "upload.pdf", pages).read_bytes()
+    results = {}
+
+    with offline_app(workdir, llm_latency=llm_latency) as bench:
+        client = bench.client
+        paper_numbers = count()
+
+        def upload():
+            n = next(paper_numbers)
+            response = client.post(
+                "/papers/",
+                files={"file": (f"paper_{n}.pdf", pdf_bytes, "application/pdf")},
+                data={"title": f"Benchmark Paper {n}", "abstract": f"Transformer retrieval study number {n}."},
+            )
+            response.raise_for_status()
+
+        results["api.upload"] = measure(upload, repeat=uploads, warmup=1)
+        results["api.upload"].update({"pages": pages})
+
+        def search():
+            client.get("/papers/search", params={"query": "transformer attention", "top_k": 5}).raise_for_status()
+
+        results["api.search"] = measure(search, repeat=20)
+
+        def similar():
+            client.get("/papers/1/similar", params={"top_k": 5}).raise_for_status()
+
+        results["api.similar"] = measure(similar, repeat=20)
+
+        def lit_review(path: str, explain: bool, fresh_topic: bool):
+            topics = count()
+
+            def call():
+                topic = f"transformer retrieval {next(topics)}" if fresh_topic else "transformer retrieval"
+                client.post(path, json={"topic": topic, "explain": explain}).raise_for_status()
+            return call
+
+        for name, path in [("local", "/papers/literature_review/local"), ("full", "/papers/literature_review/full")]:
+            results[f"api.literature_review.{name}"] = measure(lit_review(path, False, False), repeat=10)
+            results[f"api.literature_review.{name}.explain_cold"] = measure(lit_review(path, True, True), repeat=10)
+            results[f"api.literature_review.{name}.explain_warm"] = measure(lit_review(path, True, False), repeat=10)
+
+        results["api.fake_backend_calls"] = {
+            "chat_calls": bench.openai.chat_calls,
+            "embedding_calls": bench.openai.embedding_calls,
+            "llm_latency_ms": llm_latency * 1000.0,
+        }
+    return results
@@ -0,0 +1,30 @@
+import os
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.fixtures import make_pdf
+from benchmarks.harness import measure
+from src.parsers.pdf_parser import extract_text_from_pdf
+
+DEFAULT_PAGE_COUNTS = [1, 10, 100]
+
+
+def run(workdir: Path, page_counts: List[int] = DEFAULT_PAGE_COUNTS) -> Dict[str, dict]:
+    """Time ``extract_text_from_pdf`` on reportlab-generated PDFs and report throughput."""
+    results = {}
+    for pages in page_counts:
+        path = make_pdf(workdir / f"extract_{pages}.pdf", pages)
+        size_bytes = os.path.getsize(path)
+        characters = len(extract_text_from_pdf(str(path)))
+
+        stats = measure(lambda: extract_text_from_pdf(str(path)), repeat=5 if pages <= 10 else 3)
+        seconds = stats["median_ms"] / 1000.0
+        stats.update({
+            "pages": pages,
+            "bytes": size_bytes,
+            "characters": characters,
+            "pages_per_second": pages / seconds if seconds else None,
+            "megabytes_per_second": size_bytes / 1e6 / seconds if seconds else None,
+        })
+        results[f"pdf_extraction.{pages}_pages"] = stats
+    return results
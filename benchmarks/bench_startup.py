@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+from benchmarks.harness import offline_environment, summarize
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import src.main; "
+    "print((time.perf_counter() - start) * 1000.0)"
+)
+
+
+def run(workdir: Path, repeat: int = 5) -> Dict[str, dict]:
+    """Time a cold ``import src.main`` (app creation included) in fresh interpreters."""
+    env = dict(os.environ)
+    env.update(offline_environment(workdir))
+
+    process_ms, import_ms = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET],
+            cwd=workdir, env=env, capture_output=True, text=True, check=True
+        )
+        process_ms.append((time.perf_counter() - start) * 1000.0)
+        import_ms.append(float(completed.stdout.strip().splitlines()[-1]))
+
+    return {
+        "startup.process": summarize(process_ms),
+        "startup.import_app": summarize(import_ms),
+    }
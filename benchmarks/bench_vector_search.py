@@ -0,0 +1,76 @@
+import os
+from typing import Dict, List, Optional
+import numpy as np
+
+from benchmarks.fakes import EMBEDDING_DIMENSION
+from benchmarks.harness import measure
+from src.core.vector_store import VectorStore
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# A Python float list costs a pointer plus a float object per element.
+LIST_BYTES_PER_ELEMENT = 8 + 24
+ARRAY_BYTES_PER_ELEMENT = 4
+
+
+def default_memory_budget() -> int:
+    """Half of physical memory where it can be detected, otherwise 8 GB."""
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 2
+    except (AttributeError, ValueError, OSError):
+        return 8 * 1024 ** 3
+
+
+def run(
+    sizes: List[int] = DEFAULT_SIZES,
+    dimension: int = EMBEDDING_DIMENSION,
+    top_k: int = 5,
+    seed: int = 0,
+    memory_budget: Optional[int] = None
+) -> Dict[str, dict]:
+    """Time ``VectorStore.similarity_search`` against stores of increasing size.
+
+    ``upload_paper`` stores each OpenAI embedding as a Python list, and every search converts
+    those lists back to numpy arrays, so embeddings are stored as lists here too whenever they
+    fit in ``memory_budget``. At the default 1536 dimensions that is about 49 GB for a million
+    vectors, which does not fit on typical machines. Larger stores fall back to float32 ndarray
+    rows, which skip the list-to-array conversion and are therefore much faster than production.
+    Sizes that do not fit either way are skipped. Each result records its ``storage`` format.
+    """
+    memory_budget = memory_budget or default_memory_budget()
+    rng = np.random.default_rng(seed)
+    results = {}
+    for size in sizes:
+        key = f"vector_search.in_memory.{size}"
+        elements = size * dimension
+        if elements * LIST_BYTES_PER_ELEMENT <= memory_budget:
+            storage = "list"
+        elif elements * ARRAY_BYTES_PER_ELEMENT <= memory_budget:
+            storage = "float32_ndarray"
+        else:
+            results[key] = {
+                "vectors": size, "dimension": dimension, "storage": "skipped",
+                "reason": f"needs more than the {memory_budget / 1024 ** 3:.1f} GB memory budget",
+            }
+            continue
+
+        store = VectorStore()
+        chunk = 10_000
+        for start in range(0, size, chunk):
+            rows = rng.standard_normal((min(chunk, size - start), dimension), dtype=np.float32)
+            for offset, row in enumerate(rows.tolist() if storage == "list" else rows):
+                paper_id = start + offset
+                store.add_document(paper_id, row, {"title": f"Paper {paper_id}"})
+
+        queries = rng.standard_normal((8, dimension), dtype=np.float32).tolist()
+        query_iter = iter(range(1 << 30))
+
+        def search():
+            return store.similarity_search(queries[next(query_iter) % len(queries)], top_k=top_k)
+
+        repeat = 5 if size <= 10_000 else 2
+        stats = measure(search, repeat=repeat, warmup=1)
+        stats.update({"vectors": size, "dimension": dimension, "top_k": top_k, "storage": storage})
+        results[key] = stats
+        del store
+    return results
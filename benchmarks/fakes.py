@@ -0,0 +1,85 @@
+import hashlib
+import re
+import time
+from types import SimpleNamespace
+from typing import List
+import numpy as np
+
+EMBEDDING_DIMENSION = 1536
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def fake_embedding(text: str, dimension: int = EMBEDDING_DIMENSION) -> List[float]:
+    """Deterministic bag-of-words embedding: texts sharing words get similar vectors."""
+    vector = np.zeros(dimension, dtype=np.float32)
+    for token in _TOKEN_RE.findall(text.lower()):
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        vector[value % dimension] += 1.0 if value & (1 << 63) else -1.0
+    norm = np.linalg.norm(vector)
+    if norm:
+        vector /= norm
+    return vector.tolist()
+
+
+def _count_tokens(text: str) -> int:
+    return len(_TOKEN_RE.findall(text))
+
+
+class _FakeCompletions:
+    def __init__(self, owner: "FakeOpenAIClient"):
+        self.owner = owner
+
+    def create(self, model: str, messages: List[dict], temperature: float = 0.7, **kwargs):
+        self.owner.chat_calls += 1
+        if self.owner.latency:
+            time.sleep(self.owner.latency)
+        prompt = messages[-1]["content"]
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:12]
+        content = f"Fake completion {digest} for a {len(prompt)}-character prompt."
+        usage = SimpleNamespace(prompt_tokens=_count_tokens(prompt), completion_tokens=_count_tokens(content))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+
+class _FakeEmbeddings:
+    def __init__(self, owner: "FakeOpenAIClient"):
+        self.owner = owner
+
+    def create(self, input: List[str], model: str, **kwargs):
+        self.owner.embedding_calls += 1
+        if self.owner.latency:
+            time.sleep(self.owner.latency)
+        tokens = sum(_count_tokens(text) for text in input)
+        usage = SimpleNamespace(prompt_tokens=tokens, total_tokens=tokens)
+        return SimpleNamespace(data=[SimpleNamespace(embedding=fake_embedding(text)) for text in input], usage=usage)
+
+
+class FakeOpenAIClient:
+    """Offline stand-in for the ``openai.OpenAI`` client used by ``src.core.llm``."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.chat_calls = 0
+        self.embedding_calls = 0
+        self.chat = SimpleNamespace(completions=_FakeCompletions(self))
+        self.embeddings = _FakeEmbeddings(self)
+
+
+class FakeArxivTool:
+    """Offline stand-in for ``ArxivAPIWrapper`` returning results in the same text format."""
+
+    def __init__(self, results: int = 3):
+        self.results = results
+
+    def run(self, query: str) -> str:
+        entries = []
+        for i in range(self.results):
+            entries.append("\n".join([
+                f"Published: 2024-01-{i + 1:02d}",
+                f"Title: {query.title()} Study {i + 1}",
+                f"Authors: Author {i + 1}",
+                f"Abstract: An investigation of {query} from perspective number {i + 1}.",
+                f"URL: http://arxiv.org/abs/2401.{i + 1:05d}",
+            ]))
+        return "\n\n".join(entries)
@@ -0,0 +1,24 @@
+from pathlib import Path
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+WORDS = (
+    "transformer attention embedding retrieval corpus citation neural graph "
+    "language model evaluation benchmark dataset training inference latency"
+).split()
+
+
+def make_pdf(path: Path, pages: int, lines_per_page: int = 45) -> Path:
+    """Generate a text-only PDF with ``pages`` pages of deterministic pseudo-academic prose."""
+    c = canvas.Canvas(str(path), pagesize=letter)
+    _, height = letter
+    for page in range(pages):
+        y = height - 72
+        for line in range(lines_per_page):
+            offset = page * lines_per_page + line
+            words = [WORDS[(offset * 7 + i * 3) % len(WORDS)] for i in range(12)]
+            c.drawString(72, y, " ".join(words))
+            y -= 14
+        c.showPage()
+    c.save()
+    return path
@@ -0,0 +1,92 @@
+import logging
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+import yaml
+
+from benchmarks.fakes import FakeOpenAIClient, FakeArxivTool
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples_ms)
+    p95_index = min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))
+    return {
+        "runs": len(ordered),
+        "min_ms": ordered[0],
+        "mean_ms": statistics.fmean(ordered),
+        "median_ms": statistics.median(ordered),
+        "p95_ms": ordered[p95_index],
+        "max_ms": ordered[-1],
+    }
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, warmup: int = 1) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return summarize(samples)
+
+
+def offline_environment(workdir: Path) -> Dict[str, str]:
+    """Write an offline config into ``workdir`` and return the env vars that point the app at it."""
+    (workdir / "config").mkdir(parents=True, exist_ok=True)
+    (workdir / "data" / "raw").mkdir(parents=True, exist_ok=True)
+
+    database_url = f"sqlite:///{workdir / 'bench.db'}"
+    config = {
+        "environment": "benchmark",
+        "openai_api_key": "offline-benchmark-key",
+        "database": {"url": database_url},
+        "vector_store": {"type": "memory"},
+        "knn_graph": {"path": str(workdir / "data" / "knn_graph.npz"), "k": 10, "block_size": 1024},
+        "lit_review": {"explain_max_workers": 4},
+    }
+    config_path = workdir / "config" / "config.yaml"
+    with open(config_path, "w") as f:
+        yaml.safe_dump(config, f)
+
+    return {
+        "CONFIG_PATH": str(config_path),
+        "DATABASE_URL": database_url,
+        "OPENAI_API_KEY": config["openai_api_key"],
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), os.getenv("PYTHONPATH")])),
+    }
+
+
+@contextmanager
+def offline_app(workdir: Path, llm_latency: float = 0.0):
+    """Import the app against an offline config, with fake OpenAI and Arxiv backends patched in."""
+    os.environ.update(offline_environment(workdir))
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        from fastapi.testclient import TestClient
+        import src.core.llm as llm_module
+        from src.main import app
+        from src.api.routes import papers
+        from src.database.database import Base, engine
+
+        logging.getLogger().setLevel(logging.WARNING)
+        Base.metadata.create_all(bind=engine)
+
+        fake_openai = FakeOpenAIClient(latency=llm_latency)
+        llm_module.client = fake_openai
+        papers.lit_review_agent.arxiv_tool = FakeArxivTool()
+
+        yield SimpleNamespace(client=TestClient(app), openai=fake_openai, papers=papers)
+    finally:
+        os.chdir(previous_cwd)
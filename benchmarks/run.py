@@ -0,0 +1,104 @@
+"""Offline benchmark runner.
+
+Usage::
+
+    python -m benchmarks.run
+    python -m benchmarks.run --only vector_search --sizes 10000 100000
+    python -m benchmarks.run --compare benchmarks/results/previous.json
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks import bench_api, bench_pdf_extraction, bench_startup, bench_vector_search
+from benchmarks.fakes import EMBEDDING_DIMENSION
+from benchmarks.harness import REPO_ROOT
+
+SUITES = ["vector_search", "pdf_extraction", "api", "startup"]
+RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run offline performance benchmarks.")
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=SUITES, help="Suites to run.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=bench_vector_search.DEFAULT_SIZES,
+                        help="Vector store sizes for the vector search suite.")
+    parser.add_argument("--dimension", type=int, default=EMBEDDING_DIMENSION,
+                        help="Embedding dimension for the vector search suite.")
+    parser.add_argument("--memory-budget-gb", type=float, default=None,
+                        help="Memory the vector search suite may use per store (default: half of physical memory).")
+    parser.add_argument("--pages", nargs="+", type=int, default=bench_pdf_extraction.DEFAULT_PAGE_COUNTS,
+                        help="Page counts for the PDF extraction suite.")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0,
+                        help="Simulated latency of each fake OpenAI call in the API suite.")
+    parser.add_argument("--output", type=Path, default=None, help="Where to write the JSON results.")
+    parser.add_argument("--compare", type=Path, default=None, help="Previous results file to compare against.")
+    return parser.parse_args(argv)
+
+
+def compare(current: dict, baseline: dict) -> list:
+    rows = []
+    for name, stats in current.items():
+        previous = baseline.get(name, {})
+        # Timings taken with a different storage format measure a different code path.
+        if stats.get("storage") != previous.get("storage"):
+            continue
+        if "median_ms" in stats and previous.get("median_ms"):
+            rows.append((name, previous["median_ms"], stats["median_ms"], stats["median_ms"] / previous["median_ms"]))
+    return rows
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        workdir = Path(tmp)
+        if "vector_search" in args.only:
+            memory_budget = int(args.memory_budget_gb * 1024 ** 3) if args.memory_budget_gb else None
+            results.update(bench_vector_search.run(sizes=args.sizes, dimension=args.dimension,
+                                                   memory_budget=memory_budget))
+        if "pdf_extraction" in args.only:
+            results.update(bench_pdf_extraction.run(workdir, page_counts=args.pages))
+        if "startup" in args.only:
+            (workdir / "startup").mkdir()
+            results.update(bench_startup.run(workdir / "startup"))
+        if "api" in args.only:
+            (workdir / "api").mkdir()
+            results.update(bench_api.run(workdir / "api", llm_latency=args.llm_latency_ms / 1000.0))
+
+    timestamp = datetime.now(timezone.utc)
+    report = {
+        "timestamp": timestamp.isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    output = args.output or RESULTS_DIR / f"bench-{timestamp.strftime('%Y%m%dT%H%M%SZ')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for name, stats in results.items():
+        if "median_ms" in stats:
+            storage = f"   [{stats['storage']}]" if "storage" in stats else ""
+            print(f"{name:<50} median {stats['median_ms']:>10.2f} ms   p95 {stats['p95_ms']:>10.2f} ms{storage}")
+        elif stats.get("storage") == "skipped":
+            print(f"{name:<50} skipped: {stats['reason']}")
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        print(f"\nComparison against {args.compare} (ratio > 1 is slower):")
+        for name, before, after, ratio in compare(results, baseline):
+            print(f"{name:<50} {before:>10.2f} -> {after:>10.2f} ms   x{ratio:.2f}")
+
+
+if __name__ == "__main__":
+    main()
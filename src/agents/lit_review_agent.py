@@ -1,10 +1,14 @@
+import contextvars
 import logging
-from typing import List, Dict, Any
-from langchain.llms import OpenAI
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Hashable, Optional, Tuple
 from langchain.utilities import ArxivAPIWrapper
 
 from src.core.llm import LLM
 from src.core.vector_store import VectorStore
+from src.utils.metrics import span, increment
 
 logger = logging.getLogger(__name__)
 
@@ -15,18 +19,25 @@ class LitReviewAgent:
         llm: LLM,
         vector_store: VectorStore,
         openai_api_key: str,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        explain_max_workers: int = 4,
+        explanation_cache_size: int = 1024
     ):
         self.llm = llm
         self.vector_store = vector_store
         self.openai_api_key = openai_api_key
+        self.temperature = temperature
+        self.explain_max_workers = explain_max_workers
+        # Shared by all requests, so explain_max_workers caps concurrent LLM calls process-wide.
+        self._explain_executor = ThreadPoolExecutor(max_workers=max(1, explain_max_workers),
+                                                    thread_name_prefix="explain")
 
-        self.langchain_llm = OpenAI(
-            openai_api_key=openai_api_key,
-            temperature=temperature
-        )
         self.arxiv_tool = ArxivAPIWrapper()
 
+        self.explanation_cache_size = explanation_cache_size
+        self._explanation_cache: "OrderedDict[Tuple[str, Hashable], str]" = OrderedDict()
+        self._explanation_lock = threading.Lock()
+
     def recommend_local_papers(self, text: str, top_k: int = 5) -> List[Dict[str, Any]]:
         logger.info("Generating embedding for input text to find relevant local papers...")
         query_embedding = self.llm.get_embedding(text)
@@ -36,7 +47,12 @@ class LitReviewAgent:
 
     def recommend_external_papers(self, text: str, max_results: int = 3) -> List[Dict[str, Any]]:
         logger.info(f"Querying Arxiv for text: '{text}' (max_results={max_results})")
-        search_results = self.arxiv_tool.run(text)
+        try:
+            with span("arxiv"):
+                search_results = self.arxiv_tool.run(text)
+        except Exception:
+            increment("errors_total", source="arxiv")
+            raise
 
         external_papers = []
         for entry in search_results.split("\n\n"):
@@ -83,15 +99,77 @@ class LitReviewAgent:
         from numpy.linalg import norm
         return dot(vec1, vec2) / (norm(vec1) * norm(vec2)) if norm(vec1) and norm(vec2) else 0.0
 
-    def explain_relevance(self, user_text: str, candidate_text: str) -> str:
-        prompt = f"""
-        The user is researching: {user_text}
+    def explain_relevance(self, user_text: str, candidate_text: str) -> Optional[str]:
+        system_prompt = (
+            "You are a helpful research assistant. "
+            "Explain concisely why a paper might be relevant to the user's research."
+        )
+
+        user_prompt = (
+            f"The user is researching: {user_text}\n\n"
+            f"Below is a paper abstract or summary:\n{candidate_text}\n\n"
+            "Briefly explain why this paper might be relevant to the user's research. "
+            "Provide a concise paragraph."
+        )
+
+        return self.llm.try_chat_completion(system_prompt, user_prompt, temperature=self.temperature)
 
-        Below is a paper abstract or summary:
-        {candidate_text}
+    @staticmethod
+    def _candidate_key(candidate: Dict[str, Any]) -> Hashable:
+        if "paper_id" in candidate:
+            return ("local", str(candidate["paper_id"]))
+        return ("external", candidate.get("url") or candidate.get("title", ""))
 
-        Briefly explain why this paper might be relevant 
-        to the user's research. Provide a concise paragraph.
-        """
-        explanation = self.langchain_llm(prompt)
-        return explanation.strip()
+    @staticmethod
+    def _candidate_text(candidate: Dict[str, Any]) -> str:
+        info = candidate.get("metadata") or candidate
+        title = info.get("title", "")
+        abstract = info.get("abstract", "")
+        return f"{title}\n{abstract}".strip()
+
+    def explain_candidates(self, user_text: str, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Attach an ``explanation`` to each candidate, running uncached LLM calls on the shared executor."""
+        topic = user_text.strip().lower()
+        pending: Dict[Hashable, List[Dict[str, Any]]] = {}
+
+        with self._explanation_lock:
+            for candidate in candidates:
+                key = (topic, self._candidate_key(candidate))
+                if key in self._explanation_cache:
+                    self._explanation_cache.move_to_end(key)
+                    candidate["explanation"] = self._explanation_cache[key]
+                else:
+                    pending.setdefault(key, []).append(candidate)
+
+        cached = len(candidates) - sum(map(len, pending.values()))
+        increment("cache_requests_total", cached, cache="relevance_explanation", result="hit")
+        increment("cache_requests_total", len(pending), cache="relevance_explanation", result="miss")
+        logger.info(f"Explaining {len(candidates)} candidate(s): {cached} cached, "
+                    f"{len(pending)} LLM call(s).")
+        if not pending:
+            return candidates
+
+        keys = list(pending)
+        texts = [self._candidate_text(pending[key][0]) for key in keys]
+        # Each task runs in a copy of the caller's context so its spans reach the request profile.
+        futures = [
+            self._explain_executor.submit(contextvars.copy_context().run, self.explain_relevance, user_text, text)
+            for text in texts
+        ]
+        explanations = [future.result() for future in futures]
+
+        with self._explanation_lock:
+            for key, explanation in zip(keys, explanations):
+                # Failed explanations are flagged on the candidates and retried on the next request.
+                if explanation is None:
+                    for candidate in pending[key]:
+                        candidate["explanation_error"] = True
+                    continue
+                for candidate in pending[key]:
+                    candidate["explanation"] = explanation
+                self._explanation_cache[key] = explanation
+                self._explanation_cache.move_to_end(key)
+                while len(self._explanation_cache) > self.explanation_cache_size:
+                    self._explanation_cache.popitem(last=False)
+
+        return candidates
@@ -0,0 +1,54 @@
+import time
+
+from src.utils.metrics import metrics, increment, start_profile, stop_profile, profile_breakdown
+
+PROFILE_HEADER = b"x-profile"
+
+
+class MetricsMiddleware:
+    """Records per-route latency and status counts, and adds a ``Server-Timing`` stage breakdown
+    to responses of requests sent with ``X-Profile: true``.
+
+    Implemented as plain ASGI rather than ``BaseHTTPMiddleware`` to keep per-request overhead low.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile_value = dict(scope["headers"]).get(PROFILE_HEADER, b"").lower()
+        profile, profile_token = start_profile() if profile_value in (b"1", b"true") else (None, None)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if profile is not None:
+                    elapsed_ms = (time.perf_counter() - start) * 1000.0
+                    stages = [
+                        f'{stage};desc="{entry["calls"]} call(s)";dur={entry["ms"]:.2f}'
+                        for stage, entry in profile_breakdown(profile).items()
+                    ]
+                    stages.append(f"total;dur={elapsed_ms:.2f}")
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", ", ".join(stages).encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if profile_token is not None:
+                stop_profile(profile_token)
+            elapsed = time.perf_counter() - start
+            route = getattr(scope.get("route"), "path", "unmatched")
+            metrics.observe("http_request_duration_seconds", elapsed, method=scope["method"], route=route)
+            increment("http_requests_total", method=scope["method"], route=route, status=status)
+            if status >= 500:
+                increment("errors_total", source="http")
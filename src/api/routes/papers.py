@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List
 import os
@@ -15,6 +15,7 @@ from src.agents.lit_review_agent import LitReviewAgent
 from src.core.llm import LLM
 from src.core.vector_store import VectorStore
 from src.core.pinecone_vector_store import PineconeVectorStore
+from src.core.knn_graph import KNNGraph
 from src.utils.config import load_config
 
 router = APIRouter()
@@ -36,13 +37,34 @@ if config.get("vector_store", {}).get("type") == "pinecone":
 else:
     global_vector_store = VectorStore()
 
+knn_config = config.get("knn_graph", {})
+global_knn_graph = KNNGraph.load(
+    path=knn_config.get("path", os.path.join("data", "knn_graph.npz")),
+    k=knn_config.get("k", 10),
+    block_size=knn_config.get("block_size", 1024),
+    save_interval=knn_config.get("save_interval", 30),
+)
+
+def backfill_knn_graph():
+    """Build the kNN graph from the vector store if it is empty. Registered as an app startup handler."""
+    if len(global_knn_graph):
+        return
+    try:
+        documents = list(global_vector_store.iter_documents())
+        if documents:
+            global_knn_graph.build(documents)
+        logger.info(f"Backfilled kNN graph with {len(documents)} paper(s) from the vector store.")
+    except Exception as e:
+        logger.warning(f"Could not backfill kNN graph from the vector store: {e}")
+
 summarizer_agent = SummarizerAgent(llm=global_llm)
 research_agent = ResearchAgent(llm=global_llm, vector_store=global_vector_store)
 lit_review_agent = LitReviewAgent(
     llm=global_llm,
     vector_store=global_vector_store,
     openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-    temperature=0.7
+    temperature=0.7,
+    explain_max_workers=config.get("lit_review", {}).get("explain_max_workers", 4)
 )
 
 @router.get("/", response_model=List[Paper])
@@ -84,6 +106,11 @@ def upload_paper(
         embedding=paper_embedding,
         metadata={"title": title, "abstract": abstract}
     )
+    global_knn_graph.add_document(
+        paper_id=db_paper.id,
+        embedding=paper_embedding,
+        metadata={"title": title, "abstract": abstract}
+    )
     logger.info(f"Paper '{db_paper.title}' (ID: {db_paper.id}) embedded and saved.")
     return db_paper
 
@@ -95,6 +122,19 @@ def get_paper(paper_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Paper not found.")
     return paper
 
+@router.get("/{paper_id}/similar")
+def get_similar_papers(paper_id: int, top_k: int = Query(5, ge=1)):
+    results = global_knn_graph.similar(paper_id, top_k=top_k)
+    if results is None:
+        logger.warning(f"Paper with ID {paper_id} not found in the similarity graph.")
+        raise HTTPException(
+            status_code=404,
+            detail="Paper not found in similarity graph. Papers that are not in the vector store are not covered "
+                   "until the graph is rebuilt with 'python -m src.scripts.rebuild_knn_graph --embed-missing'."
+        )
+    logger.debug(f"Similar papers for ID {paper_id}: top_k={top_k}, results_found={len(results)}.")
+    return {"paper_id": paper_id, "results": results}
+
 @router.post("/summarize/{paper_id}")
 def summarize_paper(paper_id: int, db: Session = Depends(get_db)):
     paper = crud.get_paper_by_id(db, paper_id)
@@ -110,6 +150,7 @@ def summarize_paper(paper_id: int, db: Session = Depends(get_db)):
 def literature_review_local(payload: dict):
     topic = payload.get("topic", "").strip()
     top_k = payload.get("top_k", 5)
+    explain = payload.get("explain") is True
 
     if not topic:
         logger.error("Literature review local: 'topic' is required.")
@@ -117,6 +158,8 @@ def literature_review_local(payload: dict):
 
     logger.debug(f"Performing local literature review for topic='{topic}' with top_k={top_k}.")
     results = lit_review_agent.recommend_local_papers(text=topic, top_k=top_k)
+    if explain:
+        lit_review_agent.explain_candidates(user_text=topic, candidates=results)
     return {"topic": topic, "results": results}
 
 
@@ -124,6 +167,7 @@ def literature_review_local(payload: dict):
 def literature_review_external(payload: dict):
     topic = payload.get("topic", "").strip()
     max_results = payload.get("max_results", 3)
+    explain = payload.get("explain") is True
 
     if not topic:
         logger.error("Literature review external: 'topic' is required.")
@@ -131,6 +175,8 @@ def literature_review_external(payload: dict):
 
     logger.debug(f"Performing external literature review for topic='{topic}' with max_results={max_results}.")
     external_refs = lit_review_agent.recommend_external_papers(text=topic, max_results=max_results)
+    if explain:
+        lit_review_agent.explain_candidates(user_text=topic, candidates=external_refs)
 
     return {"topic": topic, "external_refs": external_refs}
 
@@ -140,6 +186,7 @@ def literature_review_full(payload: dict):
     topic = payload.get("topic", "").strip()
     top_k_local = payload.get("top_k_local", 5)
     max_results_external = payload.get("max_results_external", 3)
+    explain = payload.get("explain") is True
 
     if not topic:
         logger.error("Literature review full: 'topic' is required.")
@@ -151,6 +198,8 @@ def literature_review_full(payload: dict):
 
     ranked_external = lit_review_agent.rank_papers_by_relevance(user_text=topic, candidates=external_results,
                                                                 top_k=max_results_external)
+    if explain:
+        lit_review_agent.explain_candidates(user_text=topic, candidates=local_results + ranked_external)
     return {
         "topic": topic,
         "local_results": local_results,
@@ -0,0 +1,302 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class KNNGraph:
+    """Precomputed k-nearest-neighbour graph over stored paper embeddings.
+
+    Similarities are cosine scores computed in blocked matrix multiplies so that
+    no more than ``block_size * block_size`` scores are held in memory at once.
+    Neighbour lists are kept sorted by descending score, padded with ``-1`` ids.
+
+    All reads and writes go through one lock, so uploads handled on different threads
+    can add papers concurrently. Changes are persisted to ``path`` by a background
+    save at most once every ``save_interval`` seconds, or immediately via ``flush()``.
+    """
+
+    def __init__(
+        self,
+        k: int = 10,
+        block_size: int = 1024,
+        path: Optional[str] = None,
+        save_interval: Optional[float] = 30.0
+    ):
+        self.k = k
+        self.block_size = block_size
+        self.path = path
+        self.save_interval = save_interval
+
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+
+        self.ids: List[int] = []
+        self.row_of: Dict[int, int] = {}
+        self.metadata: Dict[int, dict] = {}
+
+        self._size = 0
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._neighbor_rows = np.empty((0, k), dtype=np.int64)
+        self._neighbor_scores = np.empty((0, k), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, paper_id: int) -> bool:
+        return paper_id in self.row_of
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors[:self._size]
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _grow(self, array: np.ndarray, rows: int) -> np.ndarray:
+        capacity = array.shape[0]
+        if rows <= capacity:
+            return array
+        grown = np.empty((max(rows, capacity * 2, 16),) + array.shape[1:], dtype=array.dtype)
+        grown[:self._size] = array[:self._size]
+        return grown
+
+    def _reserve(self, rows: int, dimension: int):
+        """Make room for ``rows`` nodes, growing the vector and neighbour arrays geometrically."""
+        if self._vectors.shape[1] != dimension:
+            if self._size:
+                raise ValueError(
+                    f"Embedding dimension {dimension} does not match graph dimension {self._vectors.shape[1]}."
+                )
+            self._vectors = np.empty((0, dimension), dtype=np.float32)
+
+        self._vectors = self._grow(self._vectors, rows)
+        self._neighbor_rows = self._grow(self._neighbor_rows, rows)
+        self._neighbor_scores = self._grow(self._neighbor_scores, rows)
+
+    def _top_k(self, queries: np.ndarray, exclude_rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the ``k`` best stored rows for each query, scanning the stored vectors block by block."""
+        m = queries.shape[0]
+        best_rows = np.full((m, self.k), -1, dtype=np.int64)
+        best_scores = np.full((m, self.k), -np.inf, dtype=np.float32)
+
+        for start in range(0, self._size, self.block_size):
+            stop = min(start + self.block_size, self._size)
+            scores = queries @ self._vectors[start:stop].T
+            if exclude_rows is not None:
+                local = exclude_rows - start
+                hit = (local >= 0) & (local < stop - start)
+                scores[np.nonzero(hit)[0], local[hit]] = -np.inf
+
+            block_rows = np.broadcast_to(np.arange(start, stop), scores.shape)
+            merged_scores = np.concatenate([best_scores, scores], axis=1)
+            merged_rows = np.concatenate([best_rows, block_rows], axis=1)
+            order = np.argsort(-merged_scores, axis=1, kind="stable")[:, :self.k]
+            best_scores = np.take_along_axis(merged_scores, order, axis=1)
+            best_rows = np.take_along_axis(merged_rows, order, axis=1)
+
+        best_rows[np.isneginf(best_scores)] = -1
+        return best_rows, best_scores
+
+    def build(self, documents: List[Tuple[int, List[float], dict]]):
+        """Rebuild the whole graph from ``(paper_id, embedding, metadata)`` tuples."""
+        with self._lock:
+            self._build(documents)
+            self._mark_dirty()
+
+    def _build(self, documents: List[Tuple[int, List[float], dict]]):
+        documents = [doc for doc in documents if len(doc[1])]
+        self.ids = [paper_id for paper_id, _, _ in documents]
+        self.row_of = {paper_id: row for row, paper_id in enumerate(self.ids)}
+        self.metadata = {paper_id: metadata for paper_id, _, metadata in documents}
+
+        if not documents:
+            self._size = 0
+            self._neighbor_rows = np.empty((0, self.k), dtype=np.int64)
+            self._neighbor_scores = np.empty((0, self.k), dtype=np.float32)
+            return
+
+        matrix = self._normalize(np.asarray([doc[1] for doc in documents], dtype=np.float32))
+        self._size = 0
+        self._reserve(len(documents), matrix.shape[1])
+        self._vectors[:len(documents)] = matrix
+        self._size = len(documents)
+
+        self._neighbor_rows = np.empty((self._size, self.k), dtype=np.int64)
+        self._neighbor_scores = np.empty((self._size, self.k), dtype=np.float32)
+        for start in range(0, self._size, self.block_size):
+            stop = min(start + self.block_size, self._size)
+            rows, scores = self._top_k(self._vectors[start:stop], exclude_rows=np.arange(start, stop))
+            self._neighbor_rows[start:stop] = rows
+            self._neighbor_scores[start:stop] = scores
+
+        logger.info(f"Built kNN graph over {self._size} paper(s) with k={self.k}.")
+
+    def add_document(self, paper_id: int, embedding: List[float], metadata: dict):
+        if not len(embedding):
+            logger.warning(f"Empty embedding for paper ID {paper_id}; not added to kNN graph.")
+            return
+
+        with self._lock:
+            if self._size and len(embedding) != self._vectors.shape[1]:
+                logger.warning(
+                    f"Embedding dimension {len(embedding)} for paper ID {paper_id} does not match kNN graph "
+                    f"dimension {self._vectors.shape[1]}; not added to kNN graph. Rebuild the graph after "
+                    f"changing embedding models."
+                )
+                return
+            self._add_document(paper_id, embedding, metadata)
+            self._mark_dirty()
+
+    def _add_document(self, paper_id: int, embedding: List[float], metadata: dict):
+        if paper_id in self.row_of:
+            documents = [
+                (pid, self._vectors[row], self.metadata.get(pid, {}))
+                for pid, row in self.row_of.items() if pid != paper_id
+            ]
+            documents.append((paper_id, embedding, metadata))
+            self._build(documents)
+            return
+
+        vector = self._normalize(np.asarray([embedding], dtype=np.float32))
+        self._reserve(self._size + 1, vector.shape[1])
+        rows, scores = self._top_k(vector)
+
+        if self._size:
+            # Sims of every existing node to the new one, also computed block by block.
+            sims = np.concatenate([
+                self._vectors[start:min(start + self.block_size, self._size)] @ vector[0]
+                for start in range(0, self._size, self.block_size)
+            ])
+            improved = np.nonzero(sims > self._neighbor_scores[:self._size, -1])[0]
+            if improved.size:
+                self._neighbor_rows[improved, -1] = self._size
+                self._neighbor_scores[improved, -1] = sims[improved]
+                order = np.argsort(-self._neighbor_scores[improved], axis=1, kind="stable")
+                self._neighbor_rows[improved] = np.take_along_axis(self._neighbor_rows[improved], order, axis=1)
+                self._neighbor_scores[improved] = np.take_along_axis(self._neighbor_scores[improved], order, axis=1)
+
+        self._vectors[self._size] = vector[0]
+        self._neighbor_rows[self._size] = rows[0]
+        self._neighbor_scores[self._size] = scores[0]
+        self.row_of[paper_id] = self._size
+        self.ids.append(paper_id)
+        self.metadata[paper_id] = metadata
+        self._size += 1
+
+    def similar(self, paper_id: int, top_k: Optional[int] = None) -> Optional[List[dict]]:
+        """Return precomputed neighbours of ``paper_id``, or ``None`` if it is not in the graph."""
+        top_k = self.k if top_k is None else max(1, min(top_k, self.k))
+        with self._lock:
+            row = self.row_of.get(paper_id)
+            if row is None:
+                return None
+
+            results = []
+            for neighbor_row, score in zip(self._neighbor_rows[row, :top_k], self._neighbor_scores[row, :top_k]):
+                if neighbor_row < 0:
+                    break
+                neighbor_id = self.ids[neighbor_row]
+                results.append({
+                    "paper_id": neighbor_id,
+                    "score": float(score),
+                    "metadata": self.metadata.get(neighbor_id, {})
+                })
+            return results
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if not self.path or self.save_interval is None or self._save_timer is not None:
+            return
+        self._save_timer = threading.Timer(self.save_interval, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _snapshot(self) -> Dict[str, np.ndarray]:
+        return {
+            "k": np.array(self.k),
+            "ids": np.asarray(self.ids, dtype=np.int64),
+            "vectors": self.vectors.copy(),
+            "neighbor_rows": self._neighbor_rows[:self._size].copy(),
+            "neighbor_scores": self._neighbor_scores[:self._size].copy(),
+            "metadata": np.array(json.dumps({str(pid): meta for pid, meta in self.metadata.items()})),
+        }
+
+    def flush(self):
+        """Persist pending changes to ``path``, if there are any."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty or not self.path:
+                return
+            snapshot = self._snapshot()
+            self._dirty = False
+        self._write(self.path, snapshot)
+
+    def save(self, path: Optional[str] = None):
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            snapshot = self._snapshot()
+            if path == self.path:
+                self._dirty = False
+        self._write(path, snapshot)
+
+    def _write(self, path: str, snapshot: Dict[str, np.ndarray]):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Snapshots are taken under the graph lock; the write itself only blocks other writers.
+        with self._save_lock:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **snapshot)
+            os.replace(tmp_path, path)
+        logger.debug(f"Saved kNN graph with {len(snapshot['ids'])} paper(s) to '{path}'.")
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        k: int = 10,
+        block_size: int = 1024,
+        save_interval: Optional[float] = 30.0
+    ) -> "KNNGraph":
+        """Load a persisted graph, rebuilding it if it was saved with a different ``k``."""
+        graph = cls(k=k, block_size=block_size, path=path, save_interval=save_interval)
+        if not os.path.exists(path):
+            return graph
+
+        with np.load(path) as data:
+            ids = data["ids"].tolist()
+            vectors = data["vectors"]
+            metadata = {int(pid): meta for pid, meta in json.loads(str(data["metadata"])).items()}
+
+            if int(data["k"]) != k:
+                logger.info(f"Persisted kNN graph has k={int(data['k'])}; rebuilding with k={k}.")
+                graph.build([(pid, vectors[row], metadata.get(pid, {})) for row, pid in enumerate(ids)])
+                return graph
+
+            graph.ids = ids
+            graph.row_of = {paper_id: row for row, paper_id in enumerate(ids)}
+            graph.metadata = metadata
+            if ids:
+                graph._reserve(len(ids), vectors.shape[1])
+                graph._vectors[:len(ids)] = vectors
+                graph._neighbor_rows[:len(ids)] = data["neighbor_rows"]
+                graph._neighbor_scores[:len(ids)] = data["neighbor_scores"]
+            graph._size = len(ids)
+
+        logger.info(f"Loaded kNN graph with {graph._size} paper(s) from '{path}'.")
+        return graph
@@ -1,31 +1,61 @@
+import logging
 import os
 from openai import OpenAI
 
+from src.utils.metrics import span, increment
+
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-from typing import List
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
 
 class LLM:
     def __init__(self, api_key: str = None, model_name: str = "gpt-4o"):
         self.model_name = model_name
 
-    def chat_completion(self, system_prompt: str, user_prompt: str, temperature: float = 0.7) -> str:
+    @staticmethod
+    def _record_usage(operation: str, response):
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        # Embedding responses only report prompt tokens; don't create empty completion series for them.
+        for kind in ("prompt", "completion"):
+            tokens = getattr(usage, f"{kind}_tokens", None)
+            if tokens is not None:
+                increment("llm_tokens_total", tokens, operation=operation, kind=kind)
+
+    def try_chat_completion(self, system_prompt: str, user_prompt: str, temperature: float = 0.7) -> Optional[str]:
+        """Return the completion text, or ``None`` if the request failed (the error is logged)."""
         try:
-            response = client.chat.completions.create(model=self.model_name,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=temperature)
+            with span("llm_chat"):
+                response = client.chat.completions.create(model=self.model_name,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature)
+            self._record_usage("chat", response)
             return response.choices[0].message.content.strip()
         except Exception as e:
-            return f"Error during OpenAI ChatCompletion: {str(e)}"
+            increment("errors_total", source="llm_chat")
+            logger.error(f"Error during OpenAI ChatCompletion: {e}")
+            return None
+
+    def chat_completion(self, system_prompt: str, user_prompt: str, temperature: float = 0.7) -> str:
+        completion = self.try_chat_completion(system_prompt, user_prompt, temperature)
+        if completion is None:
+            return "Error during OpenAI ChatCompletion: the request failed; see the server logs for details."
+        return completion
 
     def get_embedding(self, text: str, engine: str = "text-embedding-ada-002") -> List[float]:
         try:
-            response = client.embeddings.create(input=[text],
-            model=engine)
+            with span("embed"):
+                response = client.embeddings.create(input=[text],
+                model=engine)
+            self._record_usage("embedding", response)
             embedding = response.data[0].embedding
             return embedding
         except Exception as e:
-            print(f"Error generating embedding: {e}")
+            increment("errors_total", source="embed")
+            logger.error(f"Error generating embedding: {e}")
             return []
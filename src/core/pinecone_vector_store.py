@@ -1,7 +1,9 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
 from pinecone.grpc import PineconeGRPC as Pinecone
 from pinecone import ServerlessSpec
 
+from src.utils.metrics import timed
+
 class PineconeVectorStore:
     def __init__(
         self,
@@ -32,6 +34,13 @@ class PineconeVectorStore:
     def add_document(self, paper_id: int, embedding: List[float], metadata: dict):
         self.index.upsert(vectors=[(str(paper_id), embedding, metadata)])
 
+    def iter_documents(self, batch_size: int = 100) -> Iterator[Tuple[int, List[float], dict]]:
+        for id_batch in self.index.list(limit=batch_size):
+            response = self.index.fetch(ids=list(id_batch))
+            for vector_id, vector in response.vectors.items():
+                yield int(vector_id), list(vector.values), dict(vector.metadata or {})
+
+    @timed("vector_search")
     def similarity_search(self, query_embedding: List[float], top_k: int = 3) -> List[dict]:
         response = self.index.query(
             vector=query_embedding,
@@ -1,6 +1,8 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Tuple
 import numpy as np
 
+from src.utils.metrics import timed
+
 class VectorStore:
 
     def __init__(self):
@@ -12,6 +14,11 @@ class VectorStore:
             "metadata": metadata
         }
 
+    def iter_documents(self) -> Iterator[Tuple[int, List[float], dict]]:
+        for paper_id, entry in list(self.docs.items()):
+            yield paper_id, entry["embedding"], entry["metadata"]
+
+    @timed("vector_search")
     def similarity_search(self, query_embedding: List[float], top_k: int = 3) -> List[dict]:
         if not self.docs:
             return []
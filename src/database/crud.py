@@ -4,6 +4,9 @@ from src.api.schemas.paper import PaperCreate
 from src.api.schemas.user import UserCreate
 from typing import List, Optional
 
+from src.utils.metrics import timed
+
+@timed("db")
 def create_paper(db: Session, paper: PaperCreate) -> models.Paper:
     db_paper = models.Paper(
         title=paper.title,
@@ -15,12 +18,15 @@ def create_paper(db: Session, paper: PaperCreate) -> models.Paper:
     db.refresh(db_paper)
     return db_paper
 
+@timed("db")
 def get_paper_by_id(db: Session, paper_id: int) -> Optional[models.Paper]:
     return db.query(models.Paper).filter(models.Paper.id == paper_id).first()
 
+@timed("db")
 def get_all_papers(db: Session) -> List[models.Paper]:
     return db.query(models.Paper).all()
 
+@timed("db")
 def create_user(db: Session, user: UserCreate) -> models.User:
     db_user = models.User(
         username=user.username,
@@ -32,11 +38,14 @@ def create_user(db: Session, user: UserCreate) -> models.User:
     db.refresh(db_user)
     return db_user
 
+@timed("db")
 def get_user_by_id(db: Session, user_id: int) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.id == user_id).first()
 
+@timed("db")
 def get_user_by_username(db: Session, username: str) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.username == username).first()
 
+@timed("db")
 def get_all_users(db: Session) -> List[models.User]:
     return db.query(models.User).all()
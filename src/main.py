@@ -1,5 +1,6 @@
 from fastapi import FastAPI
-from src.api.routes import users, papers
+from src.api.routes import users, papers, metrics
+from src.api.middleware import MetricsMiddleware
 from src.utils.logger import setup_logging
 from src.utils.config import load_config
 import os
@@ -16,9 +17,13 @@ def create_app() -> FastAPI:
     setup_logging()
 
     app = FastAPI(title="AI Academic Research Assistant")
+    app.add_middleware(MetricsMiddleware)
 
     app.include_router(users.router, prefix="/users", tags=["Users"])
     app.include_router(papers.router, prefix="/papers", tags=["Papers"])
+    app.include_router(metrics.router)
+    app.add_event_handler("startup", papers.backfill_knn_graph)
+    app.add_event_handler("shutdown", papers.global_knn_graph.flush)
 
     @app.get("/")
     def read_root():
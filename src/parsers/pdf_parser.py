@@ -1,8 +1,10 @@
 import pypdf
 
+from src.utils.metrics import span
+
 def extract_text_from_pdf(file_path: str) -> str:
     text_content = []
-    with open(file_path, 'rb') as pdf_file:
+    with span("parse"), open(file_path, 'rb') as pdf_file:
         reader = pypdf.PdfReader(pdf_file)
         for page in reader.pages:
             text_content.append(page.extract_text() or "")
@@ -0,0 +1,62 @@
+"""Rebuild the "similar papers" kNN graph.
+
+Usage::
+
+    python -m src.scripts.rebuild_knn_graph                  # from vectors already in the vector store
+    python -m src.scripts.rebuild_knn_graph --embed-missing  # also embed DB papers missing from the store
+"""
+import argparse
+import logging
+import os
+
+from src.utils.config import load_config
+from src.utils.logger import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the similar-papers kNN graph.")
+    parser.add_argument("--embed-missing", action="store_true",
+                        help="Embed papers stored in the database that have no vector yet (calls OpenAI).")
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    if "openai_api_key" in config and config["openai_api_key"]:
+        os.environ["OPENAI_API_KEY"] = config["openai_api_key"]
+    if "database" in config and "url" in config["database"]:
+        os.environ["DATABASE_URL"] = config["database"]["url"]
+    setup_logging()
+
+    # Importing the routes does not backfill the graph; that only runs as an app startup handler.
+    from src.api.routes import papers
+    from src.database import crud
+    from src.database.database import SessionLocal
+
+    documents = {paper_id: (paper_id, embedding, metadata)
+                 for paper_id, embedding, metadata in papers.global_vector_store.iter_documents()}
+    logger.info(f"Found {len(documents)} vector(s) in the vector store.")
+
+    if args.embed_missing:
+        db = SessionLocal()
+        try:
+            for paper in crud.get_all_papers(db):
+                if paper.id in documents or not paper.content:
+                    continue
+                embedding = papers.global_llm.get_embedding(paper.content)
+                if not embedding:
+                    logger.warning(f"Could not embed paper ID {paper.id}; skipped.")
+                    continue
+                metadata = {"title": paper.title, "abstract": paper.abstract}
+                papers.global_vector_store.add_document(paper_id=paper.id, embedding=embedding, metadata=metadata)
+                documents[paper.id] = (paper.id, embedding, metadata)
+        finally:
+            db.close()
+
+    papers.global_knn_graph.build(list(documents.values()))
+    papers.global_knn_graph.flush()
+    logger.info(f"Rebuilt kNN graph with {len(documents)} paper(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@ import os
 
 DEFAULT_CONFIG_PATH = "config/config.yaml"
 
-def load_config(path: str = DEFAULT_CONFIG_PATH):
+def load_config(path: str = None):
+    path = path or os.getenv("CONFIG_PATH", DEFAULT_CONFIG_PATH)
     if not os.path.exists(path):
         raise FileNotFoundError(f"Configuration file not found: {path}")
     with open(path, "r") as f:
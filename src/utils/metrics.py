@@ -0,0 +1,156 @@
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+_profile: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("profile", default=None)
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+class MetricsRegistry:
+    """In-process counters and histograms rendered in the Prometheus text exposition format."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets) + (float("inf"),)
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, List[float]]] = {}
+
+    def describe(self, name: str, kind: str, help_text: str):
+        self._help[name] = (kind, help_text)
+
+    def increment(self, name: str, value: float = 1.0, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        key = _label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            state = series.get(key)
+            if state is None:
+                # Per-bucket counts, followed by the running sum and total count.
+                state = series[key] = [0.0] * (len(self.buckets) + 2)
+            state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: {key: list(state) for key, state in series.items()}
+                          for name, series in self._histograms.items()}
+
+        for name in sorted(counters):
+            kind, help_text = self._help.get(name, ("counter", name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(counters[name].items()):
+                lines.append(f"{name}{_format_labels(key)} {value}")
+
+        for name in sorted(histograms):
+            kind, help_text = self._help.get(name, ("histogram", name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, state in sorted(histograms[name].items()):
+                cumulative = 0.0
+                for bound, bucket_count in zip(self.buckets, state):
+                    cumulative += bucket_count
+                    labels = _format_labels(key, (("le", _format_bound(bound)),))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(key)} {state[-2]}")
+                lines.append(f"{name}_count{_format_labels(key)} {state[-1]}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+metrics.describe("stage_duration_seconds", "histogram", "Time spent in instrumented stages (parse, embed, db, ...).")
+metrics.describe("http_request_duration_seconds", "histogram", "HTTP request latency by route.")
+metrics.describe("http_requests_total", "counter", "HTTP requests by route and status code.")
+metrics.describe("llm_tokens_total", "counter", "OpenAI tokens consumed by operation and kind.")
+metrics.describe("cache_requests_total", "counter", "Cache lookups by cache and result.")
+metrics.describe("errors_total", "counter", "Errors by source.")
+
+
+@contextmanager
+def span(stage: str, registry: Optional[MetricsRegistry] = None):
+    """Time a block as ``stage``; the duration also lands in the active request profile, if any."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        (registry or metrics).observe("stage_duration_seconds", elapsed, stage=stage)
+        profile = _profile.get()
+        if profile is not None:
+            profile.append((stage, elapsed))
+
+
+def timed(stage: str):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def increment(name: str, value: float = 1.0, **labels):
+    metrics.increment(name, value, **labels)
+
+
+def start_profile() -> Tuple[List[Tuple[str, float]], Token]:
+    """Start collecting spans for the current context.
+
+    Returns the list spans are appended to and a token that must be passed to ``stop_profile``.
+    """
+    profile: List[Tuple[str, float]] = []
+    return profile, _profile.set(profile)
+
+
+def stop_profile(token: Token):
+    _profile.reset(token)
+
+
+def profile_breakdown(profile: List[Tuple[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Aggregate profiled spans per stage into total milliseconds and call counts."""
+    breakdown: Dict[str, Dict[str, float]] = {}
+    for stage, elapsed in list(profile):
+        entry = breakdown.setdefault(stage, {"ms": 0.0, "calls": 0})
+        entry["ms"] += elapsed * 1000.0
+        entry["calls"] += 1
+    return breakdown
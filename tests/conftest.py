@@ -0,0 +1,4 @@
+import os
+
+# src.core.llm builds its OpenAI client at import time, which requires a key to be set.
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
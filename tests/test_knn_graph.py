@@ -0,0 +1,120 @@
+import threading
+
+import numpy as np
+
+from src.core.knn_graph import KNNGraph
+
+
+def brute_force_neighbors(vectors, k):
+    matrix = np.asarray(vectors, dtype=np.float32)
+    matrix = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+    sims = matrix @ matrix.T
+    np.fill_diagonal(sims, -np.inf)
+    return np.argsort(-sims, axis=1, kind="stable")[:, :k]
+
+
+def test_build_matches_brute_force():
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(50, 8))
+    graph = KNNGraph(k=4, block_size=7)
+    graph.build([(i, vec, {"title": f"Paper {i}"}) for i, vec in enumerate(vectors)])
+
+    expected = brute_force_neighbors(vectors, 4)
+    for paper_id in range(50):
+        neighbors = [result["paper_id"] for result in graph.similar(paper_id)]
+        assert neighbors == expected[paper_id].tolist()
+
+
+def test_incremental_add_matches_build():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(30, 8))
+    incremental = KNNGraph(k=3, block_size=4)
+    for i, vec in enumerate(vectors):
+        incremental.add_document(i, vec.tolist(), {})
+
+    built = KNNGraph(k=3, block_size=4)
+    built.build([(i, vec, {}) for i, vec in enumerate(vectors)])
+
+    for paper_id in range(30):
+        assert [r["paper_id"] for r in incremental.similar(paper_id)] == \
+            [r["paper_id"] for r in built.similar(paper_id)]
+
+
+def test_similar_handles_small_graphs_and_unknown_ids():
+    graph = KNNGraph(k=5)
+    assert graph.similar(1) is None
+
+    graph.add_document(1, [1.0, 0.0], {"title": "A"})
+    assert graph.similar(1) == []
+
+    graph.add_document(2, [1.0, 1.0], {"title": "B"})
+    results = graph.similar(1)
+    assert [r["paper_id"] for r in results] == [2]
+    assert results[0]["metadata"] == {"title": "B"}
+    assert len(graph.similar(1, top_k=-3)) == 1
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    path = str(tmp_path / "knn_graph.npz")
+    graph = KNNGraph(k=2, path=path)
+    for i, vec in enumerate([[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]]):
+        graph.add_document(i, vec, {"title": f"Paper {i}"})
+    graph.flush()
+
+    loaded = KNNGraph.load(path, k=2)
+    assert len(loaded) == 3
+    assert loaded.similar(0) == graph.similar(0)
+
+    loaded.add_document(3, [1.0, 0.05], {"title": "Paper 3"})
+    assert [r["paper_id"] for r in loaded.similar(3)] == [0, 1]
+
+    rebuilt = KNNGraph.load(path, k=1)
+    assert [r["paper_id"] for r in rebuilt.similar(0)] == [1]
+
+
+def test_concurrent_adds_keep_graph_consistent():
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(400, 8))
+    graph = KNNGraph(k=5, block_size=16)
+
+    def add_range(start):
+        for i in range(start, len(vectors), 8):
+            graph.add_document(i, vectors[i].tolist(), {})
+
+    threads = [threading.Thread(target=add_range, args=(start,)) for start in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    built = KNNGraph(k=5, block_size=16)
+    built.build([(i, vec, {}) for i, vec in enumerate(vectors)])
+
+    assert len(graph) == 400
+    for paper_id in range(400):
+        # Compare scores rather than ids: float32 near-ties may order differently.
+        scores = [r["score"] for r in graph.similar(paper_id)]
+        expected = [r["score"] for r in built.similar(paper_id)]
+        assert np.allclose(scores, expected, atol=1e-5)
+
+
+def test_adds_are_saved_by_flush_not_on_every_add(tmp_path):
+    path = tmp_path / "knn_graph.npz"
+    graph = KNNGraph(k=2, path=str(path), save_interval=None)
+    graph.add_document(1, [1.0, 0.0], {})
+    assert not path.exists()
+
+    graph.flush()
+    assert len(KNNGraph.load(str(path), k=2)) == 1
+
+
+def test_mismatched_embedding_dimension_is_skipped():
+    graph = KNNGraph(k=3)
+    graph.add_document(1, [1.0, 0.0], {})
+    graph.add_document(2, [0.0, 1.0], {})
+
+    graph.add_document(3, [1.0, 0.0, 0.0], {})
+
+    assert len(graph) == 2
+    assert 3 not in graph
+    assert [r["paper_id"] for r in graph.similar(1)] == [2]
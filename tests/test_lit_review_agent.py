@@ -0,0 +1,96 @@
+import threading
+import time
+
+from src.agents.lit_review_agent import LitReviewAgent
+
+
+class CountingLLM:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def try_chat_completion(self, system_prompt: str, user_prompt: str, temperature: float = 0.7):
+        with self.lock:
+            self.calls += 1
+            return f"Explanation #{self.calls}"
+
+
+class FailingLLM(CountingLLM):
+    def try_chat_completion(self, system_prompt: str, user_prompt: str, temperature: float = 0.7):
+        with self.lock:
+            self.calls += 1
+        return None
+
+
+def make_candidates():
+    return [
+        {"paper_id": 1, "score": 0.9, "metadata": {"title": "Local Paper", "abstract": "About transformers."}},
+        {"title": "External Paper", "abstract": "About attention.", "url": "http://arxiv.org/abs/1"},
+    ]
+
+
+def test_explain_candidates_attaches_explanations():
+    llm = CountingLLM()
+    agent = LitReviewAgent(llm=llm, vector_store=None, openai_api_key="", explain_max_workers=2)
+
+    results = agent.explain_candidates("Transformers", make_candidates())
+
+    assert llm.calls == 2
+    assert all(result["explanation"].startswith("Explanation #") for result in results)
+    assert all("explanation_error" not in result for result in results)
+
+
+def test_explain_candidates_uses_cache_per_topic_and_paper():
+    llm = CountingLLM()
+    agent = LitReviewAgent(llm=llm, vector_store=None, openai_api_key="")
+
+    first = agent.explain_candidates("Transformers", make_candidates())
+    second = agent.explain_candidates("transformers ", make_candidates())
+    assert llm.calls == 2
+    assert [r["explanation"] for r in first] == [r["explanation"] for r in second]
+
+    agent.explain_candidates("Graph neural networks", make_candidates())
+    assert llm.calls == 4
+
+
+def test_failed_explanations_are_omitted_and_not_cached():
+    llm = FailingLLM()
+    agent = LitReviewAgent(llm=llm, vector_store=None, openai_api_key="")
+
+    results = agent.explain_candidates("Transformers", make_candidates())
+    assert all("explanation" not in result for result in results)
+    assert all(result["explanation_error"] is True for result in results)
+
+    agent.explain_candidates("Transformers", make_candidates())
+    assert llm.calls == 4
+
+
+def test_explain_max_workers_caps_calls_across_concurrent_requests():
+    class SlowLLM(CountingLLM):
+        def __init__(self):
+            super().__init__()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        def try_chat_completion(self, system_prompt: str, user_prompt: str, temperature: float = 0.7):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.02)
+            with self.lock:
+                self.in_flight -= 1
+            return "Explanation"
+
+    llm = SlowLLM()
+    agent = LitReviewAgent(llm=llm, vector_store=None, openai_api_key="", explain_max_workers=2)
+
+    threads = [
+        threading.Thread(target=agent.explain_candidates, args=(f"Topic {i}", make_candidates()))
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert llm.max_in_flight == 2
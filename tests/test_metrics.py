@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.middleware import MetricsMiddleware
+from src.api.routes import metrics as metrics_routes
+from src.core.llm import LLM
+from src.utils.metrics import MetricsRegistry, metrics, span, start_profile, stop_profile, profile_breakdown
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_routes.router)
+
+    @app.get("/papers/{paper_id}/work")
+    def work(paper_id: int):
+        with span("embed"):
+            pass
+        with span("db"):
+            pass
+        return {"paper_id": paper_id}
+
+    return TestClient(app)
+
+
+def test_render_counters_and_histograms():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.describe("errors_total", "counter", "Errors by source.")
+    registry.increment("errors_total", source="llm_chat")
+    registry.increment("errors_total", 2, source="llm_chat")
+    registry.observe("stage_duration_seconds", 0.05, stage="parse")
+    registry.observe("stage_duration_seconds", 0.5, stage="parse")
+    registry.observe("stage_duration_seconds", 5.0, stage="parse")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE errors_total counter" in lines
+    assert 'errors_total{source="llm_chat"} 3.0' in lines
+    assert 'stage_duration_seconds_bucket{stage="parse",le="0.1"} 1.0' in lines
+    assert 'stage_duration_seconds_bucket{stage="parse",le="1.0"} 2.0' in lines
+    assert 'stage_duration_seconds_bucket{stage="parse",le="+Inf"} 3.0' in lines
+    assert 'stage_duration_seconds_count{stage="parse"} 3.0' in lines
+
+
+def test_span_records_into_active_profile_until_stopped():
+    registry = MetricsRegistry()
+    profile, token = start_profile()
+    try:
+        with span("embed", registry=registry):
+            pass
+        with span("embed", registry=registry):
+            pass
+        with span("db", registry=registry):
+            pass
+    finally:
+        stop_profile(token)
+
+    with span("db", registry=registry):
+        pass
+
+    breakdown = profile_breakdown(profile)
+    assert breakdown["embed"]["calls"] == 2
+    assert breakdown["db"]["calls"] == 1
+    assert 'stage_duration_seconds_count{stage="db"} 2.0' in registry.render()
+
+
+def test_metrics_endpoint_reports_route_latency(client):
+    client.get("/papers/7/work").raise_for_status()
+    client.get("/does-not-exist")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    lines = response.text.splitlines()
+    assert "# TYPE http_request_duration_seconds histogram" in lines
+    assert any(line.startswith('http_request_duration_seconds_count{method="GET",route="/papers/{paper_id}/work"}')
+               for line in lines)
+    assert any(line.startswith('http_requests_total{method="GET",route="unmatched",status="404"}')
+               for line in lines)
+    assert any(line.startswith('stage_duration_seconds_count{stage="embed"}') for line in lines)
+
+
+def test_profile_header_adds_server_timing(client):
+    profiled = client.get("/papers/1/work", headers={"X-Profile": "true"})
+    timing = profiled.headers["server-timing"]
+    assert 'embed;desc="1 call(s)";dur=' in timing
+    assert 'db;desc="1 call(s)";dur=' in timing
+    assert "total;dur=" in timing
+
+    plain = client.get("/papers/1/work")
+    assert "server-timing" not in plain.headers
+
+
+def test_token_usage_only_records_reported_kinds():
+    LLM._record_usage("embedding", SimpleNamespace(usage=SimpleNamespace(prompt_tokens=7, total_tokens=7)))
+    LLM._record_usage("chat", SimpleNamespace(usage=SimpleNamespace(prompt_tokens=5, completion_tokens=2)))
+
+    text = metrics.render()
+    assert 'llm_tokens_total{kind="prompt",operation="embedding"}' in text
+    assert 'llm_tokens_total{kind="completion",operation="embedding"}' not in text
+    assert 'llm_tokens_total{kind="completion",operation="chat"}' in text